@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import json
+import re
 import time
 import urllib.parse
 from collections.abc import Callable, Sequence
@@ -70,26 +71,30 @@ def process_request_body(request: PreparedRequestExt, hide_sensitive_values: boo
     return body
 
 
+_PART_FIELD_NAMES_TO_MASK_VALUE = (
+    "password",
+    # TODO: Add more if needed
+)
+_FORM_URLENCODED_SENSITIVE_RE = re.compile(
+    r"(?:^|(?<=&))(?P<field>[^=&]*(?:" + "|".join(map(re.escape, _PART_FIELD_NAMES_TO_MASK_VALUE)) + r")[^=&]*)"
+    r"=(?P<value>[^&]*)"
+)
+
+
 def mask_sensitive_value(body: Any, content_type: str):
     """Mask a field value when a field name of the request body contains specific word"""
     if isinstance(body, dict):
-        part_field_names_to_mask_value = [
-            "password"
-            # TODO: Add more if needed
-        ]
         for k, v in body.items():
             if isinstance(v, dict):
                 mask_sensitive_value(v, content_type)
             elif isinstance(v, list):
                 for nested_obj in v:
                     mask_sensitive_value(nested_obj, content_type)
-            elif isinstance(v, str) and any(part in k for part in part_field_names_to_mask_value):
+            elif isinstance(v, str) and any(part in k for part in _PART_FIELD_NAMES_TO_MASK_VALUE):
                 body[k] = "*" * len(v)
     elif isinstance(body, str) and content_type == "application/x-www-form-urlencoded" and "=" in body:
-        # Convert application/x-www-form-urlencoded data to a dictionary and mask sensitive values
-        parsed_body = {k: v for k, v in [p.split("=") for p in body.split("&") if p]}
-        masked_body = mask_sensitive_value(parsed_body, content_type)
-        return "&".join(f"{k}={v}" for k, v in masked_body.items())
+        # Mask sensitive values in the application/x-www-form-urlencoded data. Everything else is kept as-is
+        return _FORM_URLENCODED_SENSITIVE_RE.sub(lambda m: f"{m['field']}=" + "*" * len(m["value"]), body)
 
     return body
 
@@ -114,10 +119,8 @@ def process_response(
 
 def parse_query_strings(url: str) -> dict[str, Any] | None:
     """Parse query strings in the URL and return as a dictionary, if any"""
-    q = urlparse(url)
-    if q.query:
-        query_params = parse_qs(q.query)
-        return {k: v[0] if len(v) == 1 else v for k, v in query_params.items()}
+    if parsed_query_params := _parse_qs_cached(url):
+        return {k: v[0] if len(v) == 1 else list(v) for k, v in parsed_query_params}
 
 
 def get_response_reason(response: ResponseExt) -> str:
@@ -125,10 +128,7 @@ def get_response_reason(response: ResponseExt) -> str:
     if response.reason:
         return response.reason
     else:
-        try:
-            return HTTPStatus(response.status_code).phrase
-        except ValueError:
-            return ""
+        return _get_status_phrase(response.status_code)
 
 
 def manage_content_type(f: Callable[P, RT]) -> Callable[P, RT]:
@@ -225,12 +225,37 @@ def retry_on(
     return decorator_with_args
 
 
-@lru_cache
+_CUSTOM_REQUEST_PARAMETERS = ("quiet", "query")
+_SUPPORTED_REQUEST_PARAMETERS = [x for x in inspect.signature(Session.request).parameters if x != "self"] + list(
+    _CUSTOM_REQUEST_PARAMETERS
+)
+
+
 def get_supported_request_parameters() -> list[str]:
     """Return a list of supported request parameters"""
-    custom_parameters = ["quiet", "query"]
-    requests_lib_params = inspect.signature(Session.request).parameters.keys()
-    return [x for x in requests_lib_params if x != "self"] + custom_parameters
+    return _SUPPORTED_REQUEST_PARAMETERS
+
+
+@lru_cache(maxsize=1024)
+def _parse_qs_cached(url: str) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Parse query strings in the URL into a frozen form that is safe to cache
+
+    The same request URL is typically examined multiple times (logging, hooks, retries), so the parsed result is
+    cached per URL.
+    """
+    q = urlparse(url)
+    if not q.query:
+        return ()
+    return tuple((k, tuple(v)) for k, v in parse_qs(q.query).items())
+
+
+@lru_cache(maxsize=128)
+def _get_status_phrase(status_code: int) -> str:
+    """Resolve a status code to the HTTPStatus phrase. Unknown status codes resolve to an empty string"""
+    try:
+        return HTTPStatus(status_code).phrase
+    except ValueError:
+        return ""
 
 
 def _decode_utf8(obj: Any):
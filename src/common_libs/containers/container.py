@@ -4,7 +4,7 @@ import shlex
 import sys
 import tarfile
 from collections.abc import Callable
-from functools import cached_property, wraps
+from functools import cached_property, lru_cache, wraps
 from pathlib import Path
 from typing import Self, cast
 
@@ -25,31 +25,56 @@ logger = get_logger(__name__)
 
 APP_NAME = os.getenv("APP_NAME", default="default")
 
+_GREP_PATTERN_AND_RE = re.compile(r"\.\*")
+_GREP_PATTERN_OR_RE = re.compile(r"\|")
+
+
+@lru_cache(maxsize=256)
+def _escape_grep_pattern_cached(raw_pattern: str) -> str:
+    """Escape a grep pattern. See BaseContainer._escape_grep_pattern() for the details"""
+    sub_and = "___AND___"
+    sub_or = "___OR___"
+    p = _GREP_PATTERN_AND_RE.sub(sub_and, _GREP_PATTERN_OR_RE.sub(sub_or, raw_pattern))
+    escaped_pattern = re.escape(p).replace(sub_or, "|").replace(sub_and, ".*").replace('"', '\\"')
+    return escaped_pattern
+
+
+def _check_container_is_set(self: "BaseContainer"):
+    if self.container is None:
+        err = "Container object has not been set."
+        if not self.is_containerd:
+            err += f" Call <{type(self).__name__}>.run() first"
+        raise RuntimeError(err)
+
+
+def _should_recover_on_404(self: "BaseContainer", e: docker.errors.NotFound) -> bool:
+    return (
+        e.status_code == 404
+        and "No such container" in str(e)
+        and self.enable_automatic_recovery_on_404
+        and not self.is_containerd
+    )
+
+
+def _check_dockerd_runtime(self: "BaseContainer", func_name: str):
+    if self.is_containerd:
+        raise NotImplementedError(f"<{type(self).__name__}>.{func_name}() is not supported for containerd runtime")
+
 
 def requires_container(f):
     @wraps(f)
     def wrapper(*args, **kwargs):
         self: BaseContainer = args[0]
-        if self.container is None:
-            err = "Container object has not been set."
-            if not self.is_containerd:
-                err += f" Call <{type(self).__name__}>.run() first"
-            raise RuntimeError(err)
-        else:
-            try:
+        _check_container_is_set(self)
+        try:
+            return f(*args, **kwargs)
+        except docker.errors.NotFound as e:
+            if _should_recover_on_404(self, e):
+                logger.warning(f"The container {self.container} no longer exists. Starting a new container...")
+                self.run()
                 return f(*args, **kwargs)
-            except docker.errors.NotFound as e:
-                if (
-                    e.status_code == 404
-                    and "No such container" in str(e)
-                    and self.enable_automatic_recovery_on_404
-                    and not self.is_containerd
-                ):
-                    logger.warning(f"The container {self.container} no longer exists. Starting a new container...")
-                    self.run()
-                    return f(*args, **kwargs)
-                else:
-                    raise
+            else:
+                raise
 
     return wrapper
 
@@ -60,8 +85,7 @@ def requires_dockerd_runtime(f):
     @wraps(f)
     def wrapper(*args, **kwargs):
         self: BaseContainer = args[0]
-        if self.is_containerd:
-            raise NotImplementedError(f"<{type(self).__name__}>.{f.__name__}() is not supported for containerd runtime")
+        _check_dockerd_runtime(self, f.__name__)
         return f(*args, **kwargs)
 
     return wrapper
@@ -383,14 +407,11 @@ class BaseContainer:
                 except Exception as e:
                     logger.error(e)
 
-    def _escape_grep_pattern(self, raw_pattern: str) -> str:
+    @staticmethod
+    def _escape_grep_pattern(raw_pattern: str) -> str:
         """Escape grep pattern
 
         We escape the specified grep pattern as some characters affect the grep functionality.
         NOTE: Single quotes will be handled in shlex.quote()
         """
-        sub_and = "___AND___"
-        sub_or = "___OR___"
-        p = re.sub(r"\.\*", sub_and, re.sub(r"\|", sub_or, raw_pattern))
-        escaped_pattern = re.escape(p).replace(sub_or, "|").replace(sub_and, ".*").replace('"', '\\"')
-        return escaped_pattern
+        return _escape_grep_pattern_cached(raw_pattern)
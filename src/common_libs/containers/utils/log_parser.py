@@ -1,15 +1,34 @@
 import json
+import operator
 import re
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from typing import Any
 
 from common_libs.ansi_colors import ColorCodes, color, remove_color_code
 from common_libs.logging import get_logger
 
+try:
+    # Optional accelerator. orjson parses JSON logs significantly faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+def _json_loads(line: str) -> Any:
+    """Parse a JSON string log line, preferring orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (eg. control characters inside strings). Fall back so that anything
+            # json.loads(strict=False) accepts still parses, and anything truly invalid raises JSONDecodeError
+            pass
+    return json.loads(line, strict=False)
+
+
 def parse_streamed_logs(logs: Iterator[bytes]) -> str:
     """Parse streamed logs and apply color based on the log level
 
@@ -19,12 +38,11 @@ def parse_streamed_logs(logs: Iterator[bytes]) -> str:
     """
 
     for chunk in logs:
-        if chunk.rstrip():
-            decoded_chunk = chunk.decode("utf-8")
-            for line in decoded_chunk.splitlines():
-                if color_code := _get_log_color(line):
-                    line = _apply_color(line, color_code)
-                yield line
+        if chunk and not chunk.isspace():
+            yield from (
+                _apply_color(line, color_code) if (color_code := _get_log_color(line)) else line
+                for line in chunk.decode("utf-8").splitlines()
+            )
 
 
 def parse_json_logs(logs: str, filters: dict[str, Any] = None, formatter: str = None) -> str:
@@ -37,15 +55,19 @@ def parse_json_logs(logs: str, filters: dict[str, Any] = None, formatter: str =
 
     NOTE: Each chunk/log may contain color code(s)
     """
+    if not filters and not formatter:
+        return _parse_json_logs_plain(logs)
+
+    compiled_filters = _compile_filters(filters) if filters else None
     lines = []
     for line in logs.splitlines():
         try:
-            log = json.loads(line, strict=False)
+            log = _json_loads(line)
         except json.decoder.JSONDecodeError:
             lines.append(line)
         else:
             if isinstance(log, dict):
-                if filters and not does_log_match_filters(log, filters):
+                if compiled_filters and not _does_log_match_compiled_filters(log, compiled_filters):
                     continue
                 color_code = None
                 if log_level := log.get("levelname"):
@@ -56,8 +78,33 @@ def parse_json_logs(logs: str, filters: dict[str, Any] = None, formatter: str =
                     formatted_log = _apply_color(formatted_log, color_code)
                 lines.append(formatted_log)
             else:
+                # Apparently not all lines are guaranteed to be a JSON log. Sometimes this can be just an integer for
+                # some reason
+                logger.warning(f"Unable to parse as a dictionary: {line}")
+                lines.append(line)
+    return "\n".join(lines)
+
+
+def _parse_json_logs_plain(logs: str) -> str:
+    """Specialized fast path of parse_json_logs() for the common no-filter, no-formatter case"""
+    lines = []
+    for line in logs.splitlines():
+        try:
+            log = _json_loads(line)
+        except json.decoder.JSONDecodeError:
+            lines.append(line)
+        else:
+            if isinstance(log, dict):
+                # color codes are escaped in the dumped string. Unescape these so that output will be properly colored
+                formatted_log = json.dumps(log, indent=4).replace("\\u001b", "\u001b")
+                if (log_level := log.get("levelname")) and (color_code := _get_log_color(log_level)):
+                    formatted_log = _apply_color(formatted_log, color_code)
+                lines.append(formatted_log)
+            else:
+                # Apparently not all lines are guaranteed to be a JSON log. Sometimes this can be just an integer for
+                # some reason
                 logger.warning(f"Unable to parse as a dictionary: {line}")
-                lines.append(log)
+                lines.append(line)
     return "\n".join(lines)
 
 
@@ -77,11 +124,13 @@ def parse_streamed_json_logs(logs: Iterator[bytes], filters: dict[str, Any] = No
 
     class LogUnmatched(Exception): ...
 
+    compiled_filters = _compile_filters(filters) if filters else None
+
     def parse_json_string_line(line: str):
-        parsed_log: dict[str, Any] = json.loads(line, strict=False)
+        parsed_log: dict[str, Any] = _json_loads(line)
 
         if isinstance(parsed_log, dict):
-            if filters and not does_log_match_filters(parsed_log, filters):
+            if compiled_filters and not _does_log_match_compiled_filters(parsed_log, compiled_filters):
                 raise LogUnmatched
         else:
             # Apparently not all lines are guaranteed to be a JSON log. Sometimes this can be just an integer for some
@@ -104,7 +153,7 @@ def parse_streamed_json_logs(logs: Iterator[bytes], filters: dict[str, Any] = No
     buffered_lines = ""
     buffered_chunks = b""
     for chunk in logs:
-        if chunk.rstrip():
+        if chunk and not chunk.isspace():
             try:
                 decoded_chunk = (buffered_chunks + chunk).decode("utf-8")
             except UnicodeDecodeError:
@@ -139,45 +188,76 @@ def parse_streamed_json_logs(logs: Iterator[bytes], filters: dict[str, Any] = No
                 yield line
 
 
+FilterPredicate = Callable[[Any], bool]
+
+_COMPARISON_OPERATORS = {"<=": operator.le, ">=": operator.ge, "<": operator.lt, ">": operator.gt}
+
+# The string filter DSL: an optional "NOT " prefix followed by either a numeric comparison (eg. "<= 300"), a digit
+# string, or a literal (which may contain "*" wildcards)
+_FILTER_GRAMMAR_RE = re.compile(
+    r"^(?P<negation>NOT )?(?:\s*(?P<op><=|>=|<|>)\s*(?P<num>\d+)\s*$|(?P<digits>\d+)$|(?P<literal>.*))$",
+    re.DOTALL,
+)
+
+# Relative evaluation cost per predicate kind. Cheaper predicates are evaluated first so that a non-matching log can
+# be rejected before the expensive ones (regex matching) run
+_COST_EQUALITY = 0
+_COST_NUMERIC = 1
+_COST_WILDCARD = 2
+_COST_REGEX = 3
+
+
 def does_log_match_filters(json_log: dict[str, Any], filters: dict[str, Any]) -> bool:
     """Check if a JSON log matches the given filters"""
+    return _does_log_match_compiled_filters(json_log, _compile_filters(filters))
 
-    def apply_filter(k: str, v: Any, log: dict[str, Any], is_negation: bool = False) -> bool:
-        if k not in log:
-            return False
-
-        log_value = log[k]
-        matched = None
-        if isinstance(v, re.Pattern):
-            matched = bool(re.match(v, log_value))
-        elif (
-            isinstance(log_value, int)
-            and isinstance(v, str)
-            and any(c in filter_v and filter_v.split(c)[1].strip().isdigit() for c in ["<=", ">=", "<", ">"])
-        ):
-            matched = eval(f"{log_value}{v}") is True
-        elif isinstance(v, str):
-            if v.startswith("NOT "):
-                matched = apply_filter(k, v.replace("NOT ", ""), log, is_negation=True)
-            elif "*" in v:
-                pattern = re.escape(filter_v).replace("\\*", ".*")
-                matched = bool(re.match(f"^{pattern}$", log_value))
-            elif v.isdigit():
-                matched = any([log_value == int(v), log_value == v])
-        elif isinstance(v, bool) and log_value in ["True", "False"]:
-            matched = eval(f"{log} is {v}")
-
-        if matched is None:
-            matched = log_value == v
-
-        if is_negation:
-            return not matched
-        else:
-            return matched
 
+def _compile_filters(filters: dict[str, Any]) -> list[tuple[str, FilterPredicate]]:
+    """Compile filter values into predicates once so that per-line matching doesn't re-parse the filter DSL
+
+    The compiled predicates are ordered by evaluation cost. Since all filters must match, the order doesn't affect
+    the result
+    """
+    compiled = [(filter_k, _compile_filter(filter_v)) for filter_k, filter_v in filters.items()]
+    compiled.sort(key=lambda x: x[1][1])
+    return [(filter_k, predicate) for filter_k, (predicate, _) in compiled]
+
+
+def _compile_filter(filter_v: Any) -> tuple[FilterPredicate, int]:
+    """Compile a single filter value into a predicate (with its evaluation cost) that takes the log value"""
+    if isinstance(filter_v, re.Pattern):
+        return lambda log_value: isinstance(log_value, str) and bool(re.match(filter_v, log_value)), _COST_REGEX
+    if isinstance(filter_v, bool):
+        str_filter_v = str(filter_v)
+        return (
+            lambda log_value: log_value == str_filter_v if log_value in ["True", "False"] else log_value == filter_v
+        ), _COST_EQUALITY
+    if isinstance(filter_v, str):
+        m = _FILTER_GRAMMAR_RE.match(filter_v)
+        if m["negation"]:
+            predicate, cost = _compile_filter(filter_v[m.end("negation") :])
+            return lambda log_value: not predicate(log_value), cost
+        if m["op"]:
+            op = _COMPARISON_OPERATORS[m["op"]]
+            num = int(m["num"])
+            return (
+                lambda log_value: op(log_value, num) if isinstance(log_value, int) else log_value == filter_v
+            ), _COST_NUMERIC
+        if "*" in filter_v:
+            pattern = re.compile(re.escape(filter_v).replace("\\*", ".*"))
+            return lambda log_value: isinstance(log_value, str) and bool(pattern.fullmatch(log_value)), _COST_WILDCARD
+        if m["digits"]:
+            int_filter_v = int(filter_v)
+            return lambda log_value: log_value == int_filter_v or log_value == filter_v, _COST_EQUALITY
+    return lambda log_value: log_value == filter_v, _COST_EQUALITY
+
+
+def _does_log_match_compiled_filters(
+    json_log: dict[str, Any], compiled_filters: list[tuple[str, FilterPredicate]]
+) -> bool:
     try:
-        for filter_k, filter_v in filters.items():
-            if not apply_filter(filter_k, filter_v, json_log):
+        for filter_k, predicate in compiled_filters:
+            if filter_k not in json_log or not predicate(json_log[filter_k]):
                 return False
     except Exception as e:
         logger.error(f"Encountered an error while applying a filter:\n{type(e).__name__}: {str(e)}", exc_info=e)
@@ -185,17 +265,24 @@ def does_log_match_filters(json_log: dict[str, Any], filters: dict[str, Any]) ->
     return True
 
 
+_LOG_LEVEL_COLORS = {
+    "ERROR": ColorCodes.RED,
+    "FATAL": ColorCodes.RED,
+    "CRITICAL": ColorCodes.RED,
+    "WARNING": ColorCodes.YELLOW,
+    "DEBUG": ColorCodes.DARK_GREY,
+}
+
+
 def _get_log_color(log_part: str) -> str:
     """Return a color code based on the log level in the log or partial log"""
-    if any(level in log_part for level in ["ERROR", "FATAL", "CRITICAL"]):
-        color_code = ColorCodes.RED
-    elif "WARNING" in log_part:
-        color_code = ColorCodes.YELLOW
-    elif "DEBUG" in log_part:
-        color_code = ColorCodes.DARK_GREY
-    else:
-        color_code = None
-    return color_code
+    # Fast path for when the exact log level is given (eg. a plain "levelname" value)
+    if color_code := _LOG_LEVEL_COLORS.get(log_part):
+        return color_code
+    for level, color_code in _LOG_LEVEL_COLORS.items():
+        if level in log_part:
+            return color_code
+    return None
 
 
 def _format_log(original_line: str, parsed_log: dict[str, Any], formatter: str = None):
@@ -207,7 +294,7 @@ def _format_log(original_line: str, parsed_log: dict[str, Any], formatter: str =
                 logger.warning(
                     "One or more log keys referenced by the formatter contain color code. The color will be removed"
                 )
-                parsed_log_no_color = json.loads(remove_color_code(original_line), strict=False)
+                parsed_log_no_color = _json_loads(remove_color_code(original_line))
                 formatted_line = formatter.format_map(parsed_log_no_color)
             else:
                 # Ignore missing key(s)
@@ -219,11 +306,13 @@ def _format_log(original_line: str, parsed_log: dict[str, Any], formatter: str =
     return formatted_line
 
 
+_DEFAULT_COLOR_CODE_RE = re.compile(rf"{re.escape(ColorCodes.DEFAULT)}|{re.escape(ColorCodes.DEFAULT2)}")
+
+
 def _apply_color(line: str, color_code: str):
     """Apply a color to the line that may/may not contain text(s) with another color.
 
     Existing colored texts will be preserved as is on top of the colored line by replacing all existing "default"
     color code in the middle of the line with the new color code.
     """
-    default_color_code_pattern = rf"{re.escape(ColorCodes.DEFAULT)}|{re.escape(ColorCodes.DEFAULT2)}"
-    return color(re.sub(default_color_code_pattern, color_code, line), color_code=color_code)
+    return color(_DEFAULT_COLOR_CODE_RE.sub(color_code, line), color_code=color_code)
@@ -1,9 +1,13 @@
 import re
+from functools import lru_cache
 
 from common_libs.logging import get_logger
 
 logger = get_logger(__name__)
 
+# A line with words separated by single spaces only, ie. regular messages surrounding the table data
+_NON_TABLE_DATA_RE = re.compile(r"^\S+(?: \S+)*$")
+
 
 def parse_table_output(output: str) -> list[dict[str, str | None]]:
     """Parse tabulated command output and return it as a list of dictionaries
@@ -28,13 +32,12 @@ def parse_table_output(output: str) -> list[dict[str, str | None]]:
       'PORTS': None,
       'STATUS': 'Up 5 hours'}]
     """
-    non_table_pattern = r"^\S+(?: \S+)*$"
     lines = output.strip().splitlines()
 
     # Output could contain some messages at the beginning. Attempt to locate the correct header line.
     header_pos = 0
     for i, line in enumerate(lines):
-        if line and not re.match(non_table_pattern, line):
+        if line and not _NON_TABLE_DATA_RE.match(line):
             header_pos = i
             # Note that if none of lines match the condition, we will assume the output is a table with one column
             # even if it's just regular messages without table
@@ -47,29 +50,49 @@ def parse_table_output(output: str) -> list[dict[str, str | None]]:
         raise ValueError("The table data should contain at least one row")
 
     header_line = table_data[0].rstrip()
-    headers = re.split(r"\s{3,}", header_line)
+    headers, column_spans = _parse_header(header_line)
     table = []
     for line in table_data[1:]:
         # Output could contain some messages at the end. Ignore these lines
-        if not line or len(headers) > 1 and re.match(non_table_pattern, line):
+        if not line or len(headers) > 1 and _NON_TABLE_DATA_RE.match(line):
             logger.warning("Ignored non table data at the end of the output")
             break
 
-        row = {}
-        pos = 0
-        for i, header in enumerate(headers):
-            start = pos + header_line[pos:].index(header)
-            if i == len(headers) - 1:
-                end = len(line)
-            else:
-                offset = pos + len(header)
-                end = offset + header_line[offset:].index(headers[i + 1])
-            col_value = line[start:end].strip()
-            row[header] = col_value or None
-            pos = end
-        table.append(row)
+        values = [line[start:end].strip() or None for start, end in column_spans]
+        table.append(dict(zip(headers, values)))
 
     if not table:
         raise ValueError("Unable to parse the table data from the given output")
 
     return table
+
+
+@lru_cache(maxsize=64)
+def _parse_header(header_line: str) -> tuple[tuple[str, ...], tuple[tuple[int, int | None], ...]]:
+    """Parse the header line into header names and the (start, end) column spans used for slicing each row
+
+    Each column's values are sliced from the header's start position up to the next header's start position. The
+    last column extends to the end of each row (end=None).
+    """
+    # A header name can contain up to 2 consecutive whitespaces. 3 or more means a column boundary
+    headers = []
+    starts = []
+    start = None
+    space_run = 0
+    for i, char in enumerate(header_line):
+        if char.isspace():
+            space_run += 1
+        else:
+            if start is None:
+                start = i
+            elif space_run >= 3:
+                headers.append(header_line[start : i - space_run])
+                starts.append(start)
+                start = i
+            space_run = 0
+    if start is not None:
+        headers.append(header_line[start:])
+        starts.append(start)
+    headers = tuple(headers)
+    column_spans = tuple((start, starts[i + 1] if i + 1 < len(starts) else None) for i, start in enumerate(starts))
+    return headers, column_spans